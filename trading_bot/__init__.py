@@ -3,4 +3,37 @@ Binance Futures Testnet Trading Bot
 A professional CLI-based trading bot for executing MARKET and LIMIT orders.
 """
 
+import importlib
+
 __version__ = "1.0.0"
+
+__all__ = [
+    "OrderExecutor",
+    "BinanceFuturesClient",
+    "InputValidator",
+    "APIError",
+    "ValidationError",
+]
+
+# Public name -> (module, attribute). Resolved on first access (PEP 562) so
+# `python -m trading_bot` does not pull in binance/requests/dotenv up front.
+_LAZY = {
+    "OrderExecutor": ("trading_bot.orders", "OrderExecutor"),
+    "BinanceFuturesClient": ("trading_bot.api_client", "BinanceFuturesClient"),
+    "APIError": ("trading_bot.api_client", "APIError"),
+    "InputValidator": ("trading_bot.validation", "InputValidator"),
+    "ValidationError": ("trading_bot.validation", "ValidationError"),
+}
+
+
+def __getattr__(name):
+    if name in _LAZY:
+        module_name, attr = _LAZY[name]
+        value = getattr(importlib.import_module(module_name), attr)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
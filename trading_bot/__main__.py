@@ -1,9 +1,48 @@
 """
 Main entry point for the trading_bot package when executed as a module.
 Allows running: python -m trading_bot [command]
+
+Help and version requests are answered here, before the CLI (and with it the
+Binance client stack and config loading) is imported.
+"""
+
+import sys
+from trading_bot import __version__
+
+USAGE = """usage: python -m trading_bot <command> [options]
+
+Binance Futures Trading Bot
+
+commands:
+  health-check          Check bot connection and testnet status
+  account-info          Get account information and balance
+  place-order           Place a new order (use --interactive for guided mode)
+  place-orders-batch    Place multiple orders from a JSON file
+  place-orders-async    Place multiple orders from a JSON file concurrently (asyncio)
+  serve                 Read commands from stdin and run them in one process
+
+options:
+  -h, --help            Show this help message and exit
+  --version             Show program version and exit
+
+Run 'python -m trading_bot <command> --help' for command options.
 """
 
-from trading_bot.cli import main
+
+def main():
+    """Answer help/version requests directly, otherwise hand off to the CLI."""
+    argv = sys.argv[1:]
+    if not argv or argv[0] in ("-h", "--help"):
+        sys.stdout.write(USAGE)
+        sys.exit(0)
+
+    if argv[0] == "--version":
+        sys.stdout.write(f"trading_bot {__version__}\n")
+        sys.exit(0)
+
+    from trading_bot.cli import main as cli_main
+    cli_main()
+
 
 if __name__ == "__main__":
     main()
@@ -1,17 +1,97 @@
-from typing import Dict, Any
+import time
+import socket
+import logging
+import functools
+from concurrent.futures import ThreadPoolExecutor
+from decimal import Decimal, InvalidOperation
+from typing import Dict, Any, List, Optional, Tuple, Union
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from binance.client import Client
 from binance.exceptions import BinanceAPIException, BinanceOrderException, BinanceOrderUnknownSymbolException, BinanceOrderInactiveSymbolException, BinanceRequestException
-from trading_bot.config import API_KEY, API_SECRET, USE_TESTNET, ENVIRONMENT
+from trading_bot.config import get_config, BATCH_ORDER_LIMIT, BATCH_ORDER_WORKERS, EXCHANGE_INFO_TTL
 from trading_bot.logging_config import get_logger
+from trading_bot.validation import ValidationError, InputValidator
 
 logger = get_logger(__name__)
 
+# Debug response dumps use orjson when available (much faster than stdlib json)
+try:
+    import orjson
+
+    def _dumps(obj: Any) -> str:
+        return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS, default=str).decode()
+except ImportError:
+    import json
+
+    def _dumps(obj: Any) -> str:
+        return json.dumps(obj, default=str)
+
+# Binance errors that carry a status/error code and message from the API
+_BINANCE_ORDER_ERRORS = (
+    BinanceAPIException,
+    BinanceOrderException,
+    BinanceOrderUnknownSymbolException,
+    BinanceOrderInactiveSymbolException,
+)
+
 
 class APIError(Exception):
     """Custom exception for API-related errors."""
     pass
 
 
+def _format_number(value: Union[Decimal, float, str]) -> Union[float, str]:
+    """Render Decimals in plain notation (str() may use exponents Binance rejects)."""
+    if isinstance(value, Decimal):
+        return format(value, "f")
+    return value
+
+
+def to_api_error(action: str, error: Exception) -> APIError:
+    """
+    Log a failed python-binance call and convert it to APIError.
+    Expected Binance errors are logged without a traceback; only
+    unexpected errors pay for traceback formatting.
+
+    Args:
+        action: Description of the call for error messages
+        error: Exception raised by python-binance
+
+    Returns:
+        APIError to raise in place of the original exception
+    """
+    # Use the already-parsed exception fields rather than str(error)
+    if isinstance(error, _BINANCE_ORDER_ERRORS):
+        status = getattr(error, "status_code", None) or getattr(error, "code", None)
+        error_msg = f"Binance API Error ({status}): {error.message}"
+        logger.error(error_msg, extra={
+                     "error_code": getattr(error, "code", None), "action": action})
+
+    elif isinstance(error, BinanceRequestException):
+        error_msg = f"Binance Request Error: {getattr(error, 'message', error)}"
+        logger.error(error_msg, extra={"action": action})
+
+    else:
+        error_msg = f"Unexpected error during {action}: {str(error)}"
+        logger.error(error_msg, exc_info=error)
+
+    return APIError(error_msg)
+
+
+class _LowLatencyAdapter(HTTPAdapter):
+    """HTTPAdapter whose pooled sockets disable Nagle and enable TCP keep-alive."""
+
+    SOCKET_OPTIONS = [
+        (socket.IPPROTO_TCP, socket.TCP_NODELAY, 1),
+        (socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1),
+    ]
+
+    def init_poolmanager(self, *args, **kwargs):
+        kwargs["socket_options"] = self.SOCKET_OPTIONS
+        super().init_poolmanager(*args, **kwargs)
+
+
 class BinanceFuturesClient:
     """
     Manages communication with Binance Futures API.
@@ -23,30 +103,55 @@ class BinanceFuturesClient:
 
     def __init__(self):
         """Initialize Binance Futures API client with testnet or production configuration."""
+        config = get_config()
+        config.require_credentials()
+
         # Log environment
-        env_msg = f"Initializing Binance Futures client with {ENVIRONMENT.upper()} environment"
-        if ENVIRONMENT == "production":
+        if config.environment == "production":
             logger.warning(
                 "🚨 PRODUCTION MODE ENABLED - REAL TRADES WILL BE EXECUTED 🚨")
         else:
-            logger.info(f"✓ {env_msg} (testnet - safe to test)")
+            logger.info(
+                "✓ Initializing Binance Futures client with %s environment (testnet - safe to test)", config.environment_upper)
 
         # Initialize client with appropriate settings
         self.client = Client(
-            api_key=API_KEY,
-            api_secret=API_SECRET,
-            testnet=USE_TESTNET
+            api_key=config.api_key,
+            api_secret=config.api_secret,
+            testnet=config.use_testnet,
+            requests_params={"timeout": 10}
+        )
+
+        # Keep connections alive so sequential calls reuse the TCP/TLS session
+        adapter = _LowLatencyAdapter(
+            pool_connections=4,
+            pool_maxsize=16,
+            max_retries=Retry(total=2, backoff_factor=0.2)
         )
-        logger.info(
-            f"Binance Futures client initialized with {'testnet' if USE_TESTNET else 'production'} endpoint")
+        self.client.session.mount("https://", adapter)
+        self.client.session.mount("http://", adapter)
+        self.client.session.headers["Connection"] = "keep-alive"
+
+        # Pre-bound endpoint methods (skip attribute lookups per call;
+        # also a convenient seam for patching in tests)
+        self._create_order = self.client.futures_create_order
+        self._get_order = self.client.futures_get_order
+        self._account = self.client.futures_account
+
+        # Exchange metadata changes rarely, so it is cached with a long TTL
+        self._exchange_info_cache = None
+        self._exchange_info_ts = 0.0
+        self._symbol_info_cache = {}
+        logger.info("Binance Futures client initialized with %s endpoint",
+                    "testnet" if config.use_testnet else "production")
 
     def place_order(
         self,
         symbol: str,
         side: str,
         order_type: str,
-        quantity: float,
-        price: float = None,
+        quantity: Union[Decimal, float, str],
+        price: Optional[Union[Decimal, float, str]] = None,
         time_in_force: str = "GTC"
     ) -> Dict[str, Any]:
         """
@@ -66,49 +171,238 @@ class BinanceFuturesClient:
         Raises:
             APIError: If order placement fails
         """
-        try:
-            # Build order parameters
-            params = {
-                "symbol": symbol,
-                "side": side.upper(),
-                "type": order_type.upper(),
-                "quantity": quantity,
-            }
-
-            # Add price for limit orders
-            if order_type.upper() == "LIMIT":
-                params["price"] = price
-                params["timeInForce"] = time_in_force
-
-            # Log request details
-            logger.debug(f"Placing order with parameters: {params}")
-            logger.info(
-                f"Submitting {order_type} {side} order: {quantity} {symbol} @ {price or 'market price'}"
-            )
+        _log_info = logger.info
+        params = self._build_order_params(
+            symbol, side, order_type, quantity, price, time_in_force)
+        log_extra = {"symbol": symbol, "side": params["side"],
+                     "order_type": params["type"]}
 
-            # Execute order using futures endpoint
-            response = self.client.futures_create_order(**params)
+        # Log request details
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Placing order with parameters: %s", params)
+        _log_info("Submitting %s %s order: %s %s @ %s", order_type, side,
+                  quantity, symbol, price or "market price", extra=log_extra)
 
-            # Log successful response
-            logger.info(
-                f"Order placed successfully. Order ID: {response.get('orderId')}")
+        # Execute order using futures endpoint
+        response = self._call_api(
+            "order placement", self._create_order, **params)
 
-            return response
+        # Log successful response
+        _log_info("Order placed successfully. Order ID: %s",
+                  response.get("orderId"), extra=log_extra)
 
-        except (BinanceAPIException, BinanceOrderException, BinanceOrderUnknownSymbolException, BinanceOrderInactiveSymbolException) as e:
-            error_msg = f"Binance API Error ({e.status_code}): {e.message}"
-            logger.error(error_msg, exc_info=True)
-            raise APIError(error_msg) from e
+        return response
 
-        except BinanceRequestException as e:
-            error_msg = f"Binance Request Error: {str(e)}"
-            logger.error(error_msg, exc_info=True)
-            raise APIError(error_msg) from e
+    @staticmethod
+    def _call_api(action: str, func, *args, **kwargs) -> Any:
+        """
+        Invoke a python-binance call and convert failures to APIError.
 
+        Args:
+            action: Description of the call for error messages
+            func: python-binance client method
+            *args: Positional arguments for func
+            **kwargs: Keyword arguments for func
+
+        Returns:
+            Response from func
+
+        Raises:
+            APIError: If the call fails
+        """
+        try:
+            return func(*args, **kwargs)
         except Exception as e:
-            error_msg = f"Unexpected error during order placement: {str(e)}"
-            logger.error(error_msg, exc_info=True)
-            raise APIError(error_msg) from e
+            raise to_api_error(action, e) from e
+
+    @staticmethod
+    def _build_order_params(
+        symbol: str,
+        side: str,
+        order_type: str,
+        quantity: Union[Decimal, float, str],
+        price: Optional[Union[Decimal, float, str]] = None,
+        time_in_force: str = "GTC"
+    ) -> Dict[str, Any]:
+        """
+        Build the Binance request parameters for a single order.
+
+        Args:
+            symbol: Trading pair (e.g., BTCUSDT)
+            side: BUY or SELL
+            order_type: MARKET or LIMIT
+            quantity: Order quantity
+            price: Order price (required for LIMIT orders)
+            time_in_force: Time in force (GTC, IOC, etc.)
+
+        Returns:
+            Order parameters for the futures order endpoints
+
+        Raises:
+            APIError: If the order is malformed (checked locally, before any request)
+        """
+        # Same allow-lists and spellings as the input validation layer
+        try:
+            side = InputValidator.canonicalize_side(side)
+            order_type = InputValidator.canonicalize_order_type(order_type)
+        except ValidationError as e:
+            raise APIError(str(e)) from None
+
+        try:
+            positive = Decimal(str(quantity)) > 0
+        except InvalidOperation:
+            positive = False
+        if not positive:
+            raise APIError(f"Order quantity must be a positive number, got: {quantity}")
+
+        if order_type == "LIMIT":
+            if price is None:
+                raise APIError("LIMIT order requires a price")
+            return BinanceFuturesClient._limit_params(
+                symbol, side, quantity, price, time_in_force)
+        return BinanceFuturesClient._market_params(symbol, side, quantity)
+
+    @staticmethod
+    def _market_params(
+        symbol: str,
+        side: str,
+        quantity: Union[Decimal, float, str]
+    ) -> Dict[str, Any]:
+        """Build parameters for a MARKET order (side must be canonical)."""
+        return {
+            "symbol": symbol,
+            "side": side,
+            "type": "MARKET",
+            "quantity": _format_number(quantity),
+        }
+
+    @staticmethod
+    def _limit_params(
+        symbol: str,
+        side: str,
+        quantity: Union[Decimal, float, str],
+        price: Union[Decimal, float, str],
+        time_in_force: str
+    ) -> Dict[str, Any]:
+        """Build parameters for a LIMIT order (side must be canonical)."""
+        return {
+            "symbol": symbol,
+            "side": side,
+            "type": "LIMIT",
+            "quantity": _format_number(quantity),
+            "price": _format_number(price),
+            "timeInForce": time_in_force,
+        }
+
+    def place_orders_batch(
+        self,
+        orders: List[Dict[str, Any]],
+        parallel: bool = False
+    ) -> List[Tuple[bool, Any]]:
+        """
+        Place several orders with as few HTTP round trips as possible.
+
+        By default orders are sent through the native batchOrders endpoint,
+        BATCH_ORDER_LIMIT orders per request. With parallel=True each order is
+        sent as its own request from a bounded thread pool instead.
+
+        Args:
+            orders: Order dicts using the place_order keyword arguments
+            parallel: Dispatch individual requests concurrently
+
+        Returns:
+            One (success, response or APIError) tuple per order, in input order
+        """
+        if parallel:
+            return self._place_orders_parallel(orders)
+
+        results: List[Optional[Tuple[bool, Any]]] = [None] * len(orders)
+
+        # Build params per order so one malformed order only fails itself;
+        # batchOrders is sent as JSON, which requires string values
+        pending = []
+        for index, order in enumerate(orders):
+            try:
+                params = self._build_order_params(**order)
+            except (APIError, TypeError) as e:
+                # TypeError: not a dict, or unknown/missing order fields
+                error = e if isinstance(e, APIError) else APIError(f"Invalid order: {e}")
+                logger.error("Order #%d rejected before sending: %s", index + 1, error)
+                results[index] = (False, error)
+                continue
+            pending.append(
+                (index, {key: str(value) for key, value in params.items()}))
+
+        for start in range(0, len(pending), BATCH_ORDER_LIMIT):
+            chunk = pending[start:start + BATCH_ORDER_LIMIT]
+            batch = [params for _, params in chunk]
+            logger.info("Submitting batch of %d orders", len(batch))
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("Batch order parameters: %s", batch)
+
+            try:
+                responses = self._call_api(
+                    "batch order placement", self.client.futures_place_batch_order,
+                    batchOrders=batch)
+            except APIError as e:
+                for index, _ in chunk:
+                    results[index] = (False, e)
+                continue
+
+            # Each entry is either an order or an error object for that order
+            for (index, _), response in zip(chunk, responses):
+                if "orderId" in response:
+                    logger.info("Order placed successfully. Order ID: %s",
+                                response.get("orderId"))
+                    results[index] = (True, response)
+                else:
+                    error_msg = f"Binance API Error ({response.get('code')}): {response.get('msg')}"
+                    logger.error(error_msg)
+                    results[index] = (False, APIError(error_msg))
+
+            # A short response list must not leave orders without a result
+            for index, _ in chunk[len(responses):]:
+                error_msg = "No response returned for order in batch"
+                logger.error("Order #%d: %s", index + 1, error_msg)
+                results[index] = (False, APIError(error_msg))
+
+        return results
+
+    def _place_orders_parallel(
+        self,
+        orders: List[Dict[str, Any]]
+    ) -> List[Tuple[bool, Any]]:
+        """
+        Place orders as concurrent individual requests.
+
+        Args:
+            orders: Order dicts using the place_order keyword arguments
+
+        Returns:
+            One (success, response or APIError) tuple per order, in input order
+        """
+        if not orders:
+            return []
+
+        def place(order: Dict[str, Any]) -> Dict[str, Any]:
+            # Unpack in the worker so a non-dict order fails only its future
+            return self.place_order(**order)
+
+        results: List[Tuple[bool, Any]] = []
+        workers = min(BATCH_ORDER_WORKERS, len(orders))
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            futures = [pool.submit(place, order) for order in orders]
+            for index, future in enumerate(futures):
+                try:
+                    results.append((True, future.result()))
+                except APIError as e:
+                    results.append((False, e))
+                except TypeError as e:
+                    error = APIError(f"Invalid order: {e}")
+                    logger.error("Order #%d rejected before sending: %s", index + 1, error)
+                    results.append((False, error))
+
+        return results
 
     def get_order(self, symbol: str, order_id: int) -> Dict[str, Any]:
         """
@@ -124,19 +418,14 @@ class BinanceFuturesClient:
         Raises:
             APIError: If request fails
         """
-        try:
-            logger.debug(
-                f"Fetching order details: {symbol} order_id={order_id}")
-            response = self.client.futures_get_order(
-                symbol=symbol, orderId=order_id)
-            logger.debug(
-                f"Order details retrieved: {json.dumps(response, indent=2, default=str)}")
-            return response
-
-        except Exception as e:
-            error_msg = f"Error retrieving order {order_id}: {str(e)}"
-            logger.error(error_msg, exc_info=True)
-            raise APIError(error_msg) from e
+        logger.debug("Fetching order details: %s order_id=%s", symbol, order_id)
+        response = self._call_api(
+            f"retrieval of order {order_id}", self._get_order,
+            symbol=symbol, orderId=order_id)
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Order details retrieved: %s",
+                         _dumps(response))
+        return response
 
     def get_account_info(self) -> Dict[str, Any]:
         """
@@ -148,14 +437,120 @@ class BinanceFuturesClient:
         Raises:
             APIError: If request fails
         """
-        try:
-            logger.debug("Fetching account information")
-            response = self.client.futures_account()
-            logger.debug(
-                f"Account info retrieved: {json.dumps(response, indent=2, default=str)}")
-            return response
+        logger.debug("Fetching account information")
+        response = self._call_api(
+            "account information retrieval", self._account)
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Account info retrieved: %s",
+                         _dumps(response))
+        return response
 
-        except Exception as e:
-            error_msg = f"Error retrieving account information: {str(e)}"
-            logger.error(error_msg, exc_info=True)
-            raise APIError(error_msg) from e
+    def get_account_balance(self) -> List[Dict[str, Any]]:
+        """
+        Retrieve per-asset futures balances.
+        Much lighter than get_account_info (no position list).
+
+        Returns:
+            List of asset balances
+
+        Raises:
+            APIError: If request fails
+        """
+        logger.debug("Fetching account balance")
+        return self._call_api(
+            "account balance retrieval", self.client.futures_account_balance)
+
+    def get_exchange_info(self, ttl: float = EXCHANGE_INFO_TTL, force: bool = False) -> Dict[str, Any]:
+        """
+        Retrieve exchange information, served from cache while fresh.
+
+        Args:
+            ttl: Maximum cache age in seconds
+            force: Bypass the cache and refetch
+
+        Returns:
+            Exchange information (symbols, filters, rate limits)
+
+        Raises:
+            APIError: If request fails
+        """
+        if (not force and self._exchange_info_cache is not None
+                and time.monotonic() - self._exchange_info_ts < ttl):
+            return self._exchange_info_cache
+
+        logger.debug("Fetching exchange information")
+        response = self._call_api(
+            "exchange information retrieval", self.client.futures_exchange_info)
+
+        self._exchange_info_cache = response
+        self._exchange_info_ts = time.monotonic()
+        self._symbol_info_cache = {
+            info["symbol"]: info for info in response.get("symbols", [])}
+        return response
+
+    def get_symbol_info(self, symbol: str) -> Optional[Dict[str, Any]]:
+        """
+        Retrieve cached exchange metadata (status, filters) for a symbol.
+
+        A symbol missing from an already-cached copy triggers one refresh, so
+        newly listed symbols are picked up before the TTL expires.
+
+        Args:
+            symbol: Trading pair
+
+        Returns:
+            Symbol information, or None if the exchange does not list it
+
+        Raises:
+            APIError: If request fails
+        """
+        fetched_at = self._exchange_info_ts
+        self.get_exchange_info()
+        info = self._symbol_info_cache.get(symbol)
+        # Skip the refresh when the cache was just filled by this call
+        if info is None and self._exchange_info_ts == fetched_at:
+            logger.debug("Symbol %s not in exchange info cache, refreshing", symbol)
+            self.get_exchange_info(force=True)
+            info = self._symbol_info_cache.get(symbol)
+        return info
+
+    def ping(self) -> Dict[str, Any]:
+        """
+        Test connectivity to the Futures REST API.
+
+        Returns:
+            Empty response on success
+
+        Raises:
+            APIError: If request fails
+        """
+        logger.debug("Pinging Futures API")
+        return self._call_api("ping", self.client.futures_ping)
+
+    def get_server_time(self) -> Dict[str, Any]:
+        """
+        Retrieve the Futures API server time.
+
+        Returns:
+            Server time response (serverTime in milliseconds)
+
+        Raises:
+            APIError: If request fails
+        """
+        logger.debug("Fetching server time")
+        return self._call_api("server time retrieval", self.client.futures_time)
+
+
+@functools.lru_cache(maxsize=1)
+def get_client() -> BinanceFuturesClient:
+    """
+    Get the process-wide Binance Futures client.
+
+    The client is created on first call and reused afterwards, so its
+    HTTP session and connection pool are shared by every caller.
+    Use get_client.cache_clear() to force a fresh client (e.g. in tests).
+
+    Returns:
+        Shared BinanceFuturesClient instance
+    """
+    return BinanceFuturesClient()
@@ -0,0 +1,177 @@
+"""
+Asynchronous Binance Futures client for concurrent order workloads.
+Many orders can be in flight on a single thread over one shared connection pool.
+"""
+
+import asyncio
+from decimal import Decimal
+from typing import Dict, Any, List, Optional, Tuple, Union
+import aiohttp
+from binance.client import AsyncClient
+from trading_bot.api_client import BinanceFuturesClient, to_api_error
+from trading_bot.config import get_config, ASYNC_CONNECTION_LIMIT
+from trading_bot.logging_config import get_logger
+
+logger = get_logger(__name__)
+
+
+class _PooledAsyncClient(AsyncClient):
+    """AsyncClient whose aiohttp session uses a bounded, DNS-caching connector."""
+
+    def _init_session(self) -> aiohttp.ClientSession:
+        connector = aiohttp.TCPConnector(
+            limit=ASYNC_CONNECTION_LIMIT,
+            ttl_dns_cache=300,
+            enable_cleanup_closed=True
+        )
+        return aiohttp.ClientSession(
+            loop=self.loop,
+            headers=self._get_headers(),
+            connector=connector
+        )
+
+
+class AsyncBinanceFuturesClient:
+    """
+    Async counterpart of BinanceFuturesClient for placing many orders at once.
+    Use as an async context manager so the HTTP session is always closed.
+    """
+
+    def __init__(self, client: AsyncClient):
+        """
+        Wrap an initialized python-binance AsyncClient.
+
+        Args:
+            client: Connected AsyncClient (see create())
+        """
+        self.client = client
+
+    @classmethod
+    async def create(cls) -> "AsyncBinanceFuturesClient":
+        """
+        Create and connect an async client with testnet or production configuration.
+
+        Returns:
+            Connected AsyncBinanceFuturesClient
+
+        Raises:
+            APIError: If the client cannot connect
+        """
+        config = get_config()
+        config.require_credentials()
+
+        logger.info("Initializing async Binance Futures client with %s endpoint",
+                    "testnet" if config.use_testnet else "production")
+        try:
+            client = await _PooledAsyncClient.create(
+                api_key=config.api_key,
+                api_secret=config.api_secret,
+                testnet=config.use_testnet
+            )
+        except Exception as e:
+            raise to_api_error("async client initialization", e) from e
+        return cls(client)
+
+    async def close(self) -> None:
+        """Close the underlying HTTP session."""
+        await self.client.close_connection()
+
+    async def __aenter__(self) -> "AsyncBinanceFuturesClient":
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb) -> None:
+        await self.close()
+
+    async def place_order(
+        self,
+        symbol: str,
+        side: str,
+        order_type: str,
+        quantity: Union[Decimal, float, str],
+        price: Optional[Union[Decimal, float, str]] = None,
+        time_in_force: str = "GTC"
+    ) -> Dict[str, Any]:
+        """
+        Place an order on Binance Futures.
+
+        Args:
+            symbol: Trading pair (e.g., BTCUSDT)
+            side: BUY or SELL
+            order_type: MARKET or LIMIT
+            quantity: Order quantity
+            price: Order price (required for LIMIT orders)
+            time_in_force: Time in force (GTC, IOC, etc.)
+
+        Returns:
+            Order response from API
+
+        Raises:
+            APIError: If order placement fails
+        """
+        params = BinanceFuturesClient._build_order_params(
+            symbol, side, order_type, quantity, price, time_in_force)
+
+        logger.info("Submitting %s %s order: %s %s @ %s",
+                    order_type, side, quantity, symbol, price or "market price")
+
+        try:
+            response = await self.client.futures_create_order(**params)
+        except Exception as e:
+            raise to_api_error("order placement", e) from e
+
+        logger.info("Order placed successfully. Order ID: %s",
+                    response.get("orderId"))
+        return response
+
+    async def place_orders(
+        self,
+        orders: List[Dict[str, Any]]
+    ) -> List[Tuple[bool, Any]]:
+        """
+        Place orders concurrently.
+
+        Args:
+            orders: Order dicts using the place_order keyword arguments
+
+        Returns:
+            One (success, response or APIError) tuple per order, in input order
+        """
+        responses = await asyncio.gather(
+            *(self.place_order(**order) for order in orders),
+            return_exceptions=True
+        )
+        return [(not isinstance(response, Exception), response)
+                for response in responses]
+
+
+def run(coro):
+    """
+    Run a coroutine to completion, using uvloop when it is installed.
+
+    Args:
+        coro: Coroutine to run
+
+    Returns:
+        Result of the coroutine
+    """
+    try:
+        import uvloop
+        uvloop.install()
+    except ImportError:
+        pass
+    return asyncio.run(coro)
+
+
+async def place_orders_async(orders: List[Dict[str, Any]]) -> List[Tuple[bool, Any]]:
+    """
+    Open an async client, place orders concurrently, and close it.
+
+    Args:
+        orders: Order dicts using the place_order keyword arguments
+
+    Returns:
+        One (success, response or APIError) tuple per order, in input order
+    """
+    client = await AsyncBinanceFuturesClient.create()
+    async with client:
+        return await client.place_orders(orders)
@@ -1,14 +1,53 @@
 import sys
+import json
+import shlex
+import time
 import argparse
-from typing import Optional, Dict, Any
-from trading_bot.orders import OrderExecutor
+from decimal import Decimal, InvalidOperation
+from concurrent.futures import ThreadPoolExecutor
+from concurrent.futures import TimeoutError as FutureTimeoutError
+from datetime import datetime, timezone
+from typing import Optional, Dict, Any, List, TYPE_CHECKING
+from trading_bot import __version__
 from trading_bot.validation import ValidationError, InputValidator
-from trading_bot.api_client import APIError, BinanceFuturesClient
 from trading_bot.logging_config import get_logger
-from trading_bot.config import ENVIRONMENT
+from trading_bot.config import get_config, HEALTH_CHECK_TIMEOUT
+
+# The order/API modules pull in the full binance + requests stack, so they are
+# imported inside the command handlers to keep --help and parse errors fast.
+if TYPE_CHECKING:
+    from trading_bot.orders import OrderExecutor
+    from trading_bot.api_client import BinanceFuturesClient
 
 logger = get_logger(__name__)
 
+# Section rule used around every block of CLI output
+_BAR = "=" * 60
+
+
+def _decimal_arg(value: str) -> Decimal:
+    """
+    Argparse type converter for numeric order fields.
+
+    Args:
+        value: Raw command-line value
+
+    Raises:
+        argparse.ArgumentTypeError: If value is not a finite number
+
+    Returns:
+        Parsed Decimal value
+    """
+    try:
+        number = Decimal(value)
+    except InvalidOperation:
+        raise argparse.ArgumentTypeError(f"must be numeric, got: '{value}'")
+
+    if not number.is_finite():
+        raise argparse.ArgumentTypeError(f"must be a finite number, got: '{value}'")
+
+    return number
+
 
 class TradingBotCLI:
     """
@@ -17,9 +56,33 @@ class TradingBotCLI:
     Supports both traditional command-line arguments and interactive mode.
     """
 
+    # Subcommand name -> method that registers its subparser
+    _SUBPARSER_BUILDERS = {
+        'health-check': '_build_health_parser',
+        'account-info': '_build_account_parser',
+        'place-order': '_build_order_parser',
+        'place-orders-batch': '_build_batch_parser',
+        'place-orders-async': '_build_async_parser',
+        'serve': '_build_serve_parser',
+    }
+
     def __init__(self):
         """Initialize CLI with argument parser."""
-        self.executor = OrderExecutor()
+        self._executor = None
+        self._parsers = {}
+
+    @property
+    def client(self) -> "BinanceFuturesClient":
+        """Process-wide API client (see api_client.get_client)."""
+        from trading_bot.api_client import get_client
+        return get_client()
+
+    def _get_executor(self) -> "OrderExecutor":
+        """Order executor bound to the shared API client, created on first use."""
+        if self._executor is None:
+            from trading_bot.orders import OrderExecutor
+            self._executor = OrderExecutor(self.client)
+        return self._executor
 
     def run(self, args=None):
         """
@@ -27,25 +90,89 @@ class TradingBotCLI:
 
         Args:
             args: Command-line arguments (defaults to sys.argv[1:])
+
+        Returns:
+            Process exit status (0 on success)
         """
-        parser = self._create_parser()
+        if args is None:
+            args = sys.argv[1:]
+
+        parser = self._get_parser(self._sniff_command(args))
         parsed_args = parser.parse_args(args)
 
-        # Route to appropriate command
-        if hasattr(parsed_args, 'func'):
-            parsed_args.func(parsed_args)
-        else:
-            parser.print_help()
+        # Route to appropriate command (argparse rejects a missing command)
+        func = getattr(parsed_args, 'func', None)
+        if func is not None:
+            return func(parsed_args) or 0
+        return 0
+
+    def _sniff_command(self, args) -> Optional[str]:
+        """
+        Find the subcommand in args without a full parse.
+
+        Args:
+            args: Command-line arguments
+
+        Returns:
+            Known subcommand name, or None if absent/unknown or help was requested
+        """
+        for token in args:
+            if token in ('-h', '--help'):
+                return None
+            if not token.startswith('-'):
+                return token if token in self._SUBPARSER_BUILDERS else None
+        return None
+
+    @staticmethod
+    def _wants_interactive(args) -> bool:
+        """
+        Check whether args request --interactive (or an abbreviation of it).
+
+        Args:
+            args: Command-line arguments
+
+        Returns:
+            True if any option token is a prefix of --interactive
+        """
+        for token in args:
+            if token == '--':
+                break
+            option = token.split('=', 1)[0]
+            if option.startswith('--i') and '--interactive'.startswith(option):
+                return True
+        return False
 
-    def _create_parser(self) -> argparse.ArgumentParser:
+    def _get_parser(self, command: Optional[str]) -> argparse.ArgumentParser:
+        """
+        Get the argument parser for a subcommand, built once and reused.
+
+        Args:
+            command: Subcommand to register, or None for all of them
+
+        Returns:
+            Configured ArgumentParser instance
+        """
+        if command not in self._parsers:
+            self._parsers[command] = self._create_parser(command)
+        return self._parsers[command]
+
+    def _create_parser(self, command: Optional[str] = None) -> argparse.ArgumentParser:
         """
         Create and configure argument parser.
 
+        Only the requested subcommand is registered; all subcommands are
+        registered when command is None (needed for help and error output).
+
+        Args:
+            command: Subcommand to register, or None for all of them
+
         Returns:
             Configured ArgumentParser instance
         """
         parser = argparse.ArgumentParser(
-            description=f"Binance Futures Trading Bot - {ENVIRONMENT.upper()} Mode",
+            # Kept static: building the parser must not load .env or fail on
+            # a bad ENVIRONMENT before --help or a usage error can print.
+            description="Binance Futures Trading Bot (environment set by ENVIRONMENT)",
             formatter_class=argparse.RawDescriptionHelpFormatter,
             epilog="""
 Examples:
@@ -63,24 +190,52 @@ Examples:
   
   # Get account info
   python -m trading_bot account-info
+
+  # Place several orders from a JSON file (native batch requests)
+  python -m trading_bot place-orders-batch --file orders.json
+
+  # Place several orders from a JSON file concurrently (asyncio)
+  python -m trading_bot place-orders-async --file orders.json
+
+  # Run several commands in one process (one command per stdin line)
+  printf 'health-check\naccount-info\n' | python -m trading_bot serve
             """
         )
 
+        parser.add_argument(
+            '--version',
+            action='version',
+            version=f"trading_bot {__version__}"
+        )
+
         # Create subparsers for different commands
         subparsers = parser.add_subparsers(
-            dest='command', help='Available commands')
+            dest='command', required=True, help='Available commands')
 
-        # Health check command
+        if command is None:
+            builders = self._SUBPARSER_BUILDERS.values()
+        else:
+            builders = [self._SUBPARSER_BUILDERS[command]]
+
+        for builder in builders:
+            getattr(self, builder)(subparsers)
+
+        return parser
+
+    def _build_health_parser(self, subparsers) -> None:
+        """Register the health-check command."""
         health_parser = subparsers.add_parser(
             'health-check', help='Check bot connection and testnet status')
         health_parser.set_defaults(func=self._health_check)
 
-        # Account info command
+    def _build_account_parser(self, subparsers) -> None:
+        """Register the account-info command."""
         account_parser = subparsers.add_parser(
             'account-info', help='Get account information and balance')
         account_parser.set_defaults(func=self._account_info)
 
-        # Place order command
+    def _build_order_parser(self, subparsers) -> None:
+        """Register the place-order command."""
         order_parser = subparsers.add_parser(
             'place-order', help='Place a new order')
         order_parser.add_argument(
@@ -109,11 +264,13 @@ Examples:
         order_parser.add_argument(
             '--quantity',
             required=False,
+            type=_decimal_arg,
             help='Order quantity (positive number)'
         )
         order_parser.add_argument(
             '--price',
             default=None,
+            type=_decimal_arg,
             help='Order price (required for LIMIT orders)'
         )
         order_parser.add_argument(
@@ -123,45 +280,201 @@ Examples:
         )
         order_parser.set_defaults(func=self._execute_order)
 
-        return parser
+    def _build_batch_parser(self, subparsers) -> None:
+        """Register the place-orders-batch command."""
+        batch_parser = subparsers.add_parser(
+            'place-orders-batch', help='Place multiple orders from a JSON file')
+        batch_parser.add_argument(
+            '--file',
+            required=True,
+            help='JSON file with a list of orders (symbol, side, type, quantity, price)'
+        )
+        batch_parser.add_argument(
+            '--parallel',
+            action='store_true',
+            help='Send orders as concurrent individual requests instead of batches'
+        )
+        batch_parser.set_defaults(func=self._place_orders_batch)
+
+    def _build_async_parser(self, subparsers) -> None:
+        """Register the place-orders-async command."""
+        async_parser = subparsers.add_parser(
+            'place-orders-async', help='Place multiple orders from a JSON file concurrently (asyncio)')
+        async_parser.add_argument(
+            '--file',
+            required=True,
+            help='JSON file with a list of orders (symbol, side, type, quantity, price)'
+        )
+        async_parser.set_defaults(func=self._place_orders_batch, use_async=True)
 
-    def _health_check(self, args):
+    def _build_serve_parser(self, subparsers) -> None:
+        """Register the serve command."""
+        serve_parser = subparsers.add_parser(
+            'serve', help='Read commands from stdin and run them in one process')
+        serve_parser.set_defaults(func=self._serve)
+
+    def _serve(self, args):
         """
-        Health check to verify connection and account status.
+        Run commands read line by line from stdin, reusing one API client.
+
+        Each line holds the arguments of one command, as typed after
+        'python -m trading_bot'. Blank lines and '#' comments are skipped;
+        'exit' or 'quit' (or end of input) stops the loop.
 
         Args:
             args: Parsed command-line arguments
+
+        Returns:
+            Exit status of the last command run (0 if none)
         """
-        logger.info(
-            f"Running health check on {ENVIRONMENT.upper()} environment...")
+        logger.info("Serving commands from stdin")
+        status = 0
+
+        for line in sys.stdin:
+            line = line.strip()
+            if not line or line.startswith('#'):
+                continue
+            if line in ('exit', 'quit'):
+                break
+
+            try:
+                argv: Optional[List[str]] = shlex.split(line)
+            except ValueError as e:
+                print(f"❌ Could not parse command: {str(e)}")
+                argv = None
+
+            if argv is None:
+                status = 2
+            elif self._sniff_command(argv) == 'serve':
+                print("❌ Already serving")
+                status = 2
+            elif self._wants_interactive(argv):
+                # Prompts would read the following command lines as answers
+                print("❌ Interactive mode is not available in serve mode")
+                status = 2
+            else:
+                status = self._run_served(argv)
+            # Every non-blank command line gets exactly one status line
+            sys.stdout.write(f"[exit {status}]\n")
+            sys.stdout.flush()
 
+        logger.info("Serve loop finished")
+        return status
+
+    def _run_served(self, argv: List[str]) -> int:
+        """
+        Run one served command, turning exits and errors into a status.
+
+        Args:
+            argv: Arguments of the command, without the program name
+
+        Returns:
+            Exit status of the command
+        """
         try:
-            client = BinanceFuturesClient()
-            account_info = client.get_account_info()
-
-            # Extract useful info
-            total_wallet_balance = float(
-                account_info.get('totalWalletBalance', 0))
-            total_unrealized_profit = float(
-                account_info.get('totalUnrealizedProfit', 0))
-
-            print("\n" + "=" * 60)
-            print(f"✓ Connected to {ENVIRONMENT.upper()} environment")
-            print("=" * 60)
-            print(f"Total Wallet Balance: {total_wallet_balance:.2f} USDT")
-            print(
-                f"Unrealized Profit/Loss: {total_unrealized_profit:.2f} USDT")
-            print(f"Open Positions: {account_info.get('positions', [])}")
-            print("=" * 60)
-            print("✓ Health check passed!\n")
-            logger.info("Health check completed successfully")
-            sys.exit(0)
+            return self.run(argv)
+        except SystemExit as e:
+            # argparse exits on --help and usage errors
+            return e.code if isinstance(e.code, int) else 2
+        except Exception as e:
+            # Keep serving; a failing command must not end the session
+            print(f"\n❌ Unexpected Error: {str(e)}\n")
+            logger.error("Unexpected error in served command: %s", e, exc_info=True)
+            return 1
 
+    def _health_check(self, args):
+        """
+        Health check to verify connection and account status.
+
+        Args:
+            args: Parsed command-line arguments
+
+        Returns:
+            Exit status (0 on success)
+        """
+        try:
+            # Inside the try: an invalid ENVIRONMENT is reported, not raised
+            environment = get_config().environment_upper
+            logger.info("Running health check on %s environment...", environment)
+            client = self.client
         except Exception as e:
             error_msg = f"❌ Health check failed: {str(e)}"
             print(f"\n{error_msg}\n")
-            logger.error(f"Health check error: {str(e)}", exc_info=True)
-            sys.exit(1)
+            logger.error("Health check error: %s", e, exc_info=True)
+            return 1
+
+        # Independent checks run concurrently so total latency is ~1 RTT
+        checks = {
+            'ping': client.ping,
+            'server_time': client.get_server_time,
+            'balance': client.get_account_balance,
+        }
+        results = {}
+        errors = {}
+        # One deadline bounds the whole check; the pool is not joined on exit
+        # so a hung request cannot hold the report back past the timeout.
+        pool = ThreadPoolExecutor(max_workers=4)
+        try:
+            futures = {name: pool.submit(fn) for name, fn in checks.items()}
+            deadline = time.monotonic() + HEALTH_CHECK_TIMEOUT
+            for name, future in futures.items():
+                remaining = max(0.0, deadline - time.monotonic())
+                try:
+                    results[name] = future.result(timeout=remaining)
+                except FutureTimeoutError:
+                    future.cancel()
+                    errors[name] = TimeoutError(
+                        f"timed out after {HEALTH_CHECK_TIMEOUT}s")
+                    logger.error("Health check '%s' timed out after %ss",
+                                 name, HEALTH_CHECK_TIMEOUT)
+                except Exception as e:
+                    errors[name] = e
+                    logger.error("Health check '%s' failed: %s", name, e)
+        finally:
+            pool.shutdown(wait=False)
+
+        # Build the report and write it in one call
+        lines = ["", _BAR]
+        if 'ping' in results:
+            lines.append(
+                f"✓ Connected to {environment} environment")
+        lines.append(_BAR)
+
+        if 'server_time' in results:
+            server_time = datetime.fromtimestamp(
+                results['server_time'].get('serverTime', 0) / 1000, tz=timezone.utc)
+            lines.append(f"Server Time: {server_time:%Y-%m-%d %H:%M:%S} UTC")
+
+        if 'balance' in results:
+            usdt_balances = [
+                b for b in results['balance'] if b.get('asset') == 'USDT']
+            total_wallet_balance = sum(
+                float(b.get('balance', 0)) for b in usdt_balances)
+            total_unrealized_profit = sum(
+                float(b.get('crossUnPnl', 0)) for b in usdt_balances)
+            lines.append(
+                f"Total Wallet Balance: {total_wallet_balance:.2f} USDT")
+            lines.append(
+                f"Unrealized Profit/Loss: {total_unrealized_profit:.2f} USDT")
+
+        for name, error in errors.items():
+            lines.append(f"❌ {name}: {str(error)}")
+        lines.append(_BAR)
+
+        if errors:
+            lines.append(
+                f"❌ Health check failed ({len(errors)}/{len(checks)} checks)")
+        else:
+            lines.append("✓ Health check passed!")
+        lines.append("")
+        sys.stdout.write("\n".join(lines) + "\n")
+
+        if errors:
+            logger.error("Health check failed: %s", ", ".join(errors))
+            return 1
+
+        logger.debug("Health check completed successfully")
+        return 0
 
     def _account_info(self, args):
         """
@@ -169,31 +482,34 @@ Examples:
 
         Args:
             args: Parsed command-line arguments
+
+        Returns:
+            Exit status (0 on success)
         """
         logger.info("Fetching account information...")
 
         try:
-            client = BinanceFuturesClient()
-            account_info = client.get_account_info()
-
-            print("\n" + "=" * 60)
-            print(f"Account Information ({ENVIRONMENT.upper()})")
-            print("=" * 60)
-            print(
-                f"Total Wallet Balance: {account_info.get('totalWalletBalance', 0)} USDT")
-            print(
-                f"Available Balance: {account_info.get('availableBalance', 0)} USDT")
-            print(
-                f"Total Unrealized Profit: {account_info.get('totalUnrealizedProfit', 0)} USDT")
-            print("=" * 60 + "\n")
-            logger.info("Account info retrieved successfully")
-            sys.exit(0)
+            account_info = self.client.get_account_info()
+
+            sys.stdout.write("\n".join([
+                "",
+                _BAR,
+                f"Account Information ({get_config().environment_upper})",
+                _BAR,
+                f"Total Wallet Balance: {account_info.get('totalWalletBalance', 0)} USDT",
+                f"Available Balance: {account_info.get('availableBalance', 0)} USDT",
+                f"Total Unrealized Profit: {account_info.get('totalUnrealizedProfit', 0)} USDT",
+                _BAR,
+                "",
+            ]) + "\n")
+            logger.debug("Account info retrieved successfully")
+            return 0
 
         except Exception as e:
             error_msg = f"❌ Failed to fetch account info: {str(e)}"
             print(f"\n{error_msg}\n")
-            logger.error(f"Account info error: {str(e)}", exc_info=True)
-            sys.exit(1)
+            logger.error("Account info error: %s", e, exc_info=True)
+            return 1
 
     def _execute_order(self, args):
         """
@@ -201,31 +517,130 @@ Examples:
 
         Args:
             args: Parsed command-line arguments
+
+        Returns:
+            Exit status (0 on success)
         """
+        from trading_bot.api_client import APIError
+
         try:
             # Check if interactive mode is enabled
             if getattr(args, 'interactive', False):
-                self._execute_order_interactive_mode(args)
+                return self._execute_order_interactive_mode(args)
+            return self._execute_order_traditional_mode(args)
+
+        except ValidationError as e:
+            error_msg = f"❌ Validation Error: {str(e)}"
+            print(f"\n{error_msg}\n")
+            logger.error("Validation error: %s", e)
+            return 1
+
+        except APIError as e:
+            error_msg = f"❌ API Error: {str(e)}"
+            print(f"\n{error_msg}\n")
+            logger.error("API error: %s", e)
+            return 1
+
+        except Exception as e:
+            error_msg = f"❌ Unexpected Error: {str(e)}"
+            print(f"\n{error_msg}\n")
+            logger.error("Unexpected error: %s", e, exc_info=True)
+            return 1
+
+    def _place_orders_batch(self, args):
+        """
+        Place multiple orders loaded from a JSON file.
+
+        Args:
+            args: Parsed command-line arguments
+
+        Returns:
+            Exit status (0 on success)
+        """
+        from trading_bot.api_client import APIError
+
+        logger.info("Placing orders from file: %s", args.file)
+
+        try:
+            orders = self._load_orders_file(args.file)
+            if getattr(args, 'use_async', False):
+                results = self._get_executor().execute_orders_async(orders)
             else:
-                self._execute_order_traditional_mode(args)
+                results = self._get_executor().execute_orders_batch(
+                    orders, parallel=args.parallel)
 
         except ValidationError as e:
             error_msg = f"❌ Validation Error: {str(e)}"
             print(f"\n{error_msg}\n")
-            logger.error(f"Validation error: {str(e)}")
-            sys.exit(1)
+            logger.error("Validation error: %s", e)
+            return 1
 
         except APIError as e:
             error_msg = f"❌ API Error: {str(e)}"
             print(f"\n{error_msg}\n")
-            logger.error(f"API error: {str(e)}")
-            sys.exit(1)
+            logger.error("API error: %s", e)
+            return 1
 
         except Exception as e:
             error_msg = f"❌ Unexpected Error: {str(e)}"
             print(f"\n{error_msg}\n")
-            logger.error(f"Unexpected error: {str(e)}", exc_info=True)
-            sys.exit(1)
+            logger.error("Unexpected error: %s", e, exc_info=True)
+            return 1
+
+        placed = sum(result['success'] for result in results)
+
+        lines = []
+        for index, result in enumerate(results, 1):
+            if result['success']:
+                lines.append(
+                    f"✓ #{index} {result['symbol']} Order ID: {result['orderId']} Status: {result['status']}")
+            else:
+                lines.append(
+                    f"❌ #{index} {result['symbol']}: {result['error']}")
+        lines.append(f"{placed}/{len(results)} orders placed")
+        self._print_section("BATCH RESULTS", lines)
+
+        return 0 if placed == len(results) else 1
+
+    def _load_orders_file(self, path: str) -> List[Dict[str, Any]]:
+        """
+        Load orders from a JSON file.
+
+        Args:
+            path: Path to a JSON file containing a list of order objects
+
+        Raises:
+            ValidationError: If the file cannot be read, is not valid JSON,
+                or does not contain a list of orders
+
+        Returns:
+            Order dicts with symbol, side, order_type, quantity, and price
+        """
+        try:
+            with open(path) as f:
+                data = json.load(f, parse_float=Decimal)
+        except OSError as e:
+            raise ValidationError(f"Cannot read orders file '{path}': {e.strerror or e}") from None
+        except json.JSONDecodeError as e:
+            raise ValidationError(f"Orders file '{path}' is not valid JSON: {e}") from None
+
+        if not isinstance(data, list) or not data:
+            raise ValidationError(
+                "Orders file must contain a non-empty JSON list of orders")
+
+        orders = []
+        for index, item in enumerate(data, 1):
+            if not isinstance(item, dict):
+                raise ValidationError(f"Order #{index} must be a JSON object")
+            orders.append({
+                'symbol': item.get('symbol'),
+                'side': item.get('side'),
+                'order_type': item.get('type'),
+                'quantity': item.get('quantity'),
+                'price': item.get('price'),
+            })
+
+        return orders
 
     def _execute_order_traditional_mode(self, args):
         """
@@ -233,22 +648,25 @@ Examples:
 
         Args:
             args: Parsed command-line arguments
+
+        Returns:
+            Exit status (0 on success)
         """
         # Validate that all required arguments are provided
-        if not args.symbol or not args.side or not args.order_type or not args.quantity:
+        if not args.symbol or not args.side or not args.order_type or args.quantity is None:
             print(
                 "\n❌ Error: --symbol, --side, --type, and --quantity are required for traditional mode\n")
             print("Use --interactive flag for guided mode:")
             print("  python -m trading_bot place-order --interactive\n")
             logger.error("Missing required arguments in traditional mode")
-            sys.exit(1)
+            return 1
 
         logger.info(
-            f"Executing order: symbol={args.symbol}, side={args.side}, "
-            f"type={args.order_type}, qty={args.quantity}, price={args.price}"
+            "Executing order: symbol=%s, side=%s, type=%s, qty=%s, price=%s",
+            args.symbol, args.side, args.order_type, args.quantity, args.price
         )
 
-        result = self.executor.execute_order(
+        result = self._get_executor().execute_order(
             symbol=args.symbol,
             side=args.side,
             order_type=args.order_type,
@@ -256,7 +674,7 @@ Examples:
             price=args.price
         )
 
-        sys.exit(0)
+        return 0
 
     def _execute_order_interactive_mode(self, args):
         """
@@ -264,20 +682,17 @@ Examples:
 
         Args:
             args: Parsed command-line arguments
+
+        Returns:
+            Exit status (0 on success)
         """
         logger.info("Starting interactive order mode")
 
         # Gather order details through interactive prompts
         order_params = self._prompt_for_order_details()
 
-        # Validate inputs using existing validation layer
-        InputValidator.validate_all(
-            symbol=order_params['symbol'],
-            side=order_params['side'],
-            order_type=order_params['order_type'],
-            quantity=order_params['quantity'],
-            price=order_params['price']
-        )
+        # Prompts already check symbol format, choices and numbers; full
+        # validation happens once, in OrderExecutor.execute_order
 
         # Display order summary for confirmation
         self._display_order_summary(order_params)
@@ -285,17 +700,17 @@ Examples:
         # Ask for confirmation before execution
         if not self._confirm_order_execution():
             print("\n⚠️  Order cancelled by user.\n")
-            logger.info("Order cancelled at user confirmation step")
-            sys.exit(0)
+            logger.debug("Order cancelled at user confirmation step")
+            return 0
 
         # Execute the order using existing order executor
         logger.info(
-            f"Executing interactive order: symbol={order_params['symbol']}, "
-            f"side={order_params['side']}, type={order_params['order_type']}, "
-            f"qty={order_params['quantity']}, price={order_params['price']}"
+            "Executing interactive order: symbol=%s, side=%s, type=%s, qty=%s, price=%s",
+            order_params['symbol'], order_params['side'], order_params['order_type'],
+            order_params['quantity'], order_params['price']
         )
 
-        result = self.executor.execute_order(
+        result = self._get_executor().execute_order(
             symbol=order_params['symbol'],
             side=order_params['side'],
             order_type=order_params['order_type'],
@@ -303,9 +718,9 @@ Examples:
             price=order_params['price']
         )
 
-        sys.exit(0)
+        return 0
 
-    def _prompt_for_order_details(self) -> Dict[str, Optional[str]]:
+    def _prompt_for_order_details(self) -> Dict[str, Any]:
         """
         Interactively prompt user for order details step-by-step.
 
@@ -340,7 +755,7 @@ Examples:
 
         # Prompt for price (only if LIMIT order)
         price = None
-        if order_type.upper() == "LIMIT":
+        if order_type == "LIMIT":
             price = self._prompt_for_input(
                 "Enter Price: ",
                 validate_fn=lambda x: self._validate_numeric_input(x, "Price")
@@ -395,24 +810,50 @@ Examples:
         Returns:
             Selected option
         """
-        print(f"\n{prompt}")
-        for idx, option in enumerate(options, 1):
-            print(f"  {idx}. {option}")
+        sys.stdout.write("\n".join(
+            ["", prompt, *(f"  {idx}. {option}" for idx, option in enumerate(options, 1))]) + "\n")
 
-        while True:
-            try:
-                choice = input("Enter choice (number): ").strip()
-                choice_idx = int(choice) - 1
-
-                if 0 <= choice_idx < len(options):
-                    return options[choice_idx]
-                else:
-                    print(
-                        f"❌ Invalid choice. Please enter a number between 1 and {len(options)}.")
-                    continue
-            except ValueError:
-                print(f"❌ Please enter a valid number.")
-                continue
+        # Accept either the option number or its name (case-insensitive)
+        choice_map = {str(idx): option for idx, option in enumerate(options, 1)}
+        choice_map.update({option.upper(): option for option in options})
+
+        restore_completer = self._install_completer(options)
+        try:
+            while True:
+                selected = choice_map.get(
+                    input("Enter choice (number or name): ").strip().upper())
+                if selected is not None:
+                    return selected
+                print(
+                    f"❌ Invalid choice. Enter 1-{len(options)} or one of: {', '.join(options)}.")
+        finally:
+            restore_completer()
+
+    @staticmethod
+    def _install_completer(options: list):
+        """
+        Enable Tab completion over the given options while prompting.
+
+        Args:
+            options: List of available options
+
+        Returns:
+            Callable that restores the previous completer
+        """
+        try:
+            import readline
+        except ImportError:
+            # readline is unavailable on some platforms (e.g. Windows)
+            return lambda: None
+
+        def complete(text: str, state: int) -> Optional[str]:
+            matches = [option for option in options if option.startswith(text.upper())]
+            return matches[state] if state < len(matches) else None
+
+        previous = readline.get_completer()
+        readline.set_completer(complete)
+        readline.parse_and_bind("tab: complete")
+        return lambda: readline.set_completer(previous)
 
     def _validate_and_normalize_symbol(self, symbol: str) -> str:
         """
@@ -427,18 +868,14 @@ Examples:
         Returns:
             Normalized symbol
         """
-        symbol_upper = symbol.upper().strip()
-        if not symbol_upper.endswith("USDT"):
-            raise ValueError(
-                f"Symbol must end with 'USDT' (e.g., BTCUSDT). Got: {symbol}")
-
-        if not symbol_upper[:-4].isalpha():
+        symbol_upper = symbol.strip().upper()
+        if not InputValidator.is_valid_symbol(symbol_upper):
             raise ValueError(
-                f"Symbol format invalid: {symbol}")
+                f"Invalid symbol format: '{symbol}'. Expected format: XXXUSDT (e.g., BTCUSDT).")
 
         return symbol_upper
 
-    def _validate_numeric_input(self, value: str, field_name: str) -> str:
+    def _validate_numeric_input(self, value: str, field_name: str) -> Decimal:
         """
         Validate numeric input.
 
@@ -450,40 +887,43 @@ Examples:
             ValueError: If input is not a valid positive number
 
         Returns:
-            Validated numeric string
+            Parsed value as a Decimal (passed through to the API unchanged)
         """
         try:
-            num = float(value)
-            if num <= 0:
-                raise ValueError(
-                    f"{field_name} must be positive, got: {num}")
-            return str(num)
-        except ValueError as e:
-            if "positive" in str(e):
-                raise
+            num = Decimal(value)
+        except (InvalidOperation, ValueError):
             raise ValueError(
                 f"{field_name} must be numeric, got: '{value}'")
 
-    def _display_order_summary(self, order_params: Dict[str, Optional[str]]) -> None:
+        if not num.is_finite():
+            raise ValueError(
+                f"{field_name} must be numeric, got: '{value}'")
+
+        if num <= 0:
+            raise ValueError(
+                f"{field_name} must be positive, got: {num}")
+
+        return num
+
+    def _display_order_summary(self, order_params: Dict[str, Any]) -> None:
         """
         Display formatted order summary for user review.
 
         Args:
             order_params: Dictionary with order parameters
         """
-        self._print_section_header("ORDER SUMMARY")
-
-        print(f"Symbol:       {order_params['symbol']}")
-        print(f"Side:         {order_params['side']}")
-        print(f"Type:         {order_params['order_type']}")
-        print(f"Quantity:     {order_params['quantity']}")
-
-        if order_params['order_type'].upper() == "LIMIT":
-            print(f"Price:        {order_params['price']}")
+        if order_params['order_type'] == "LIMIT":
+            price = order_params['price']
         else:
-            print(f"Price:        Market Price")
+            price = "Market Price"
 
-        self._print_section_footer()
+        self._print_section("ORDER SUMMARY", [
+            f"Symbol:       {order_params['symbol']}",
+            f"Side:         {order_params['side']}",
+            f"Type:         {order_params['order_type']}",
+            f"Quantity:     {order_params['quantity']}",
+            f"Price:        {price}",
+        ])
 
     def _confirm_order_execution(self) -> bool:
         """
@@ -509,19 +949,23 @@ Examples:
         Args:
             title: Section title
         """
-        print("\n" + "=" * 60)
-        print(f"{title:^60}")
-        print("=" * 60)
+        sys.stdout.write("\n".join(["", _BAR, f"{title:^60}", _BAR]) + "\n")
 
-    def _print_section_footer(self) -> None:
-        """Print a formatted section footer."""
-        print("=" * 60 + "\n")
+    def _print_section(self, title: str, body_lines: List[str]) -> None:
+        """
+        Print a formatted section (header, body, footer) in a single write.
+
+        Args:
+            title: Section title
+            body_lines: Lines printed between header and footer
+        """
+        sys.stdout.write("\n".join(
+            ["", _BAR, f"{title:^60}", _BAR, *body_lines, _BAR, ""]) + "\n")
 
 
 def main():
     """Main entry point for CLI."""
-    cli = TradingBotCLI()
-    cli.run()
+    sys.exit(TradingBotCLI().run())
 
 
 if __name__ == "__main__":
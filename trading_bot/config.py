@@ -1,51 +1,100 @@
 """
 Configuration module for API endpoints, constants, and environment variables.
+
+Environment-derived settings are loaded on first call to get_config(), so
+importing this module has no side effects (no .env read, no banner, no mkdir).
 """
 
 import os
-import sys
-from dotenv import load_dotenv
-
-# Load environment variables from .env file
-load_dotenv()
-
-# Environment Configuration
-ENVIRONMENT = os.getenv("ENVIRONMENT", "testnet").lower()
-if ENVIRONMENT not in ["testnet", "production"]:
-    raise ValueError(
-        f"Invalid ENVIRONMENT: {ENVIRONMENT}. Must be 'testnet' or 'production'")
-
-# Binance API Configuration
-if ENVIRONMENT == "production":
-    print("=" * 80)
-    print("⚠️  WARNING: BOT CONFIGURED FOR PRODUCTION")
-    print("Real trades will be executed. Be careful!")
-    print("=" * 80)
-    BINANCE_ENDPOINT = "https://fapi.binance.com"
-    USE_TESTNET = False
-else:
-    BINANCE_ENDPOINT = "https://testnet.binancefuture.com"
-    USE_TESTNET = True
-
-# API Credentials (from environment variables)
-API_KEY = os.getenv("BINANCE_API_KEY", "")
-API_SECRET = os.getenv("BINANCE_API_SECRET", "")
-
-# Validate API credentials are set
-if not API_KEY or not API_SECRET:
-    raise ValueError(
-        "Missing API credentials! Set BINANCE_API_KEY and BINANCE_API_SECRET in .env"
+import functools
+from dataclasses import dataclass, field
+
+
+@dataclass(frozen=True)
+class Config:
+    """Environment-derived runtime configuration."""
+
+    environment: str
+    binance_endpoint: str
+    use_testnet: bool
+    api_key: str
+    api_secret: str
+    # Upper-cased environment name for display, computed once at construction
+    environment_upper: str = field(init=False, repr=False)
+
+    def __post_init__(self) -> None:
+        object.__setattr__(self, "environment_upper", self.environment.upper())
+
+    def require_credentials(self) -> None:
+        """
+        Ensure API credentials are set.
+
+        Raises:
+            ValueError: If BINANCE_API_KEY or BINANCE_API_SECRET is missing
+        """
+        if not self.api_key or not self.api_secret:
+            raise ValueError(
+                "Missing API credentials! Set BINANCE_API_KEY and BINANCE_API_SECRET in .env"
+            )
+
+
+@functools.lru_cache(maxsize=1)
+def get_config() -> Config:
+    """
+    Load configuration from the environment and .env file (once per process).
+
+    Returns:
+        Config instance
+
+    Raises:
+        ValueError: If ENVIRONMENT is not 'testnet' or 'production'
+    """
+    from dotenv import load_dotenv
+
+    # Load environment variables from .env file
+    load_dotenv()
+
+    # Environment Configuration
+    environment = os.getenv("ENVIRONMENT", "testnet").lower()
+    if environment not in ["testnet", "production"]:
+        raise ValueError(
+            f"Invalid ENVIRONMENT: {environment}. Must be 'testnet' or 'production'")
+
+    # Binance API Configuration
+    if environment == "production":
+        print("=" * 80)
+        print("⚠️  WARNING: BOT CONFIGURED FOR PRODUCTION")
+        print("Real trades will be executed. Be careful!")
+        print("=" * 80)
+        binance_endpoint = "https://fapi.binance.com"
+        use_testnet = False
+    else:
+        binance_endpoint = "https://testnet.binancefuture.com"
+        use_testnet = True
+
+    # API Credentials (from environment variables)
+    return Config(
+        environment=environment,
+        binance_endpoint=binance_endpoint,
+        use_testnet=use_testnet,
+        api_key=os.getenv("BINANCE_API_KEY", ""),
+        api_secret=os.getenv("BINANCE_API_SECRET", ""),
     )
 
+
 # Order Configuration
 ALLOWED_ORDER_SIDES = ["BUY", "SELL"]
 ALLOWED_ORDER_TYPES = ["MARKET", "LIMIT"]
 LIMIT_ORDER_TIME_IN_FORCE = "GTC"  # Good-till-canceled
+BATCH_ORDER_LIMIT = 5  # Max orders per batchOrders request (Binance limit)
+BATCH_ORDER_WORKERS = 8  # Thread pool size for parallel order dispatch
+ASYNC_CONNECTION_LIMIT = 32  # Max open connections for the async client
+EXCHANGE_INFO_TTL = 6 * 60 * 60  # Seconds to cache exchange info (symbol filters)
+
+# Health Check Configuration
+HEALTH_CHECK_TIMEOUT = 5  # Seconds to wait for each concurrent check
 
 # Logging Configuration
 LOG_DIR = "logs"
 LOG_FORMAT = "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
 LOG_DATE_FORMAT = "%Y-%m-%d %H:%M:%S"
-
-# Ensure log directory exists
-os.makedirs(LOG_DIR, exist_ok=True)
@@ -6,13 +6,67 @@ Provides consistent logging across the application with both file and console ou
 import logging
 import os
 from datetime import datetime
+from typing import List, Optional, Set
 from trading_bot.config import LOG_DIR, LOG_FORMAT, LOG_DATE_FORMAT
 
 
+class LazyFileHandler(logging.Handler):
+    """
+    File handler that creates its timestamped log file on the first record.
+    Runs that never log (e.g. --help) leave no empty files in the log directory.
+    """
+    
+    def __init__(self, log_dir: str, prefix: str, level: int = logging.NOTSET):
+        """
+        Initialize handler without touching the filesystem.
+        
+        Args:
+            log_dir: Directory for the log file
+            prefix: Log file name prefix (a timestamp is appended)
+            level: Minimum level handled
+        """
+        super().__init__(level)
+        self.log_dir = log_dir
+        self.prefix = prefix
+        self._file_handler: Optional[logging.FileHandler] = None
+        # Set once opening the file fails, so later records skip the retry
+        self._open_failed = False
+    
+    def emit(self, record: logging.LogRecord) -> None:
+        """Open the log file if needed, then write the record to it."""
+        if self._open_failed:
+            return
+        try:
+            if self._file_handler is None:
+                os.makedirs(self.log_dir, exist_ok=True)
+                log_filename = os.path.join(
+                    self.log_dir,
+                    f"{self.prefix}_{datetime.now().strftime('%Y%m%d_%H%M%S')}.log"
+                )
+                self._file_handler = logging.FileHandler(log_filename)
+                self._file_handler.setFormatter(self.formatter)
+            self._file_handler.emit(record)
+        except Exception:
+            # A read-only or missing log directory must not break the caller;
+            # report it once and stop writing to the file
+            if self._file_handler is None:
+                self._open_failed = True
+            self.handleError(record)
+    
+    def close(self) -> None:
+        """Close the underlying file, if it was opened."""
+        if self._file_handler is not None:
+            self._file_handler.close()
+        super().close()
+
+
 class LoggerManager:
     """Manages centralized logging configuration for the application."""
     
-    _logger = None
+    # Names of loggers that already have the shared handlers attached
+    _handlers_installed: Set[str] = set()
+    # Console + file handlers shared by every logger (one log file per process)
+    _shared_handlers: Optional[List[logging.Handler]] = None
     
     @classmethod
     def get_logger(cls, name: str) -> logging.Logger:
@@ -25,47 +79,47 @@ class LoggerManager:
         Returns:
             Configured logger instance
         """
-        if cls._logger is None:
-            cls._logger = cls._setup_logger(name)
-        return cls._logger
+        logger = logging.getLogger(name)
+        if name not in cls._handlers_installed:
+            logger.setLevel(logging.DEBUG)
+            for handler in cls._get_shared_handlers():
+                logger.addHandler(handler)
+            cls._handlers_installed.add(name)
+        return logger
     
     @classmethod
-    def _setup_logger(cls, name: str) -> logging.Logger:
+    def _get_shared_handlers(cls) -> List[logging.Handler]:
         """
-        Set up logger with file and console handlers.
+        Get the shared handlers, creating them on first use.
         
-        Args:
-            name: Logger name
-            
         Returns:
-            Configured logger instance
+            Console and file handlers
         """
-        logger = logging.getLogger(name)
-        logger.setLevel(logging.DEBUG)
+        if cls._shared_handlers is None:
+            cls._shared_handlers = cls._setup_handlers()
+        return cls._shared_handlers
+    
+    @classmethod
+    def _setup_handlers(cls) -> List[logging.Handler]:
+        """
+        Set up console and file handlers with a single shared formatter.
         
-        # Avoid duplicate handlers
-        if logger.handlers:
-            return logger
+        Returns:
+            Configured handlers
+        """
+        formatter = logging.Formatter(LOG_FORMAT, datefmt=LOG_DATE_FORMAT)
         
         # Console handler - INFO level
         console_handler = logging.StreamHandler()
         console_handler.setLevel(logging.INFO)
-        console_formatter = logging.Formatter(LOG_FORMAT, datefmt=LOG_DATE_FORMAT)
-        console_handler.setFormatter(console_formatter)
-        logger.addHandler(console_handler)
+        console_handler.setFormatter(formatter)
         
-        # File handler - DEBUG level
-        log_filename = os.path.join(
-            LOG_DIR,
-            f"trading_bot_{datetime.now().strftime('%Y%m%d_%H%M%S')}.log"
-        )
-        file_handler = logging.FileHandler(log_filename)
+        # File handler - DEBUG level (file is created on first record)
+        file_handler = LazyFileHandler(LOG_DIR, "trading_bot")
         file_handler.setLevel(logging.DEBUG)
-        file_formatter = logging.Formatter(LOG_FORMAT, datefmt=LOG_DATE_FORMAT)
-        file_handler.setFormatter(file_formatter)
-        logger.addHandler(file_handler)
+        file_handler.setFormatter(formatter)
         
-        return logger
+        return [console_handler, file_handler]
 
 
 def get_logger(name: str) -> logging.Logger:
@@ -3,13 +3,28 @@ Order execution layer for managing order flow logic.
 Orchestrates validation, API calls, and response handling.
 """
 
-from typing import Dict, Any
-from trading_bot.api_client import BinanceFuturesClient, APIError
+import sys
+import logging
+import operator
+from decimal import Decimal
+from typing import Dict, Any, List, Optional, Tuple, Union
+from trading_bot.api_client import BinanceFuturesClient, APIError, get_client
 from trading_bot.validation import InputValidator, ValidationError
 from trading_bot.logging_config import get_logger
 
 logger = get_logger(__name__)
 
+# Console banner rules
+_BAR = "=" * 60
+_CHECK_BAR = "✓ " * 30
+
+# API response keys -> result keys, fetched in one itemgetter call
+_ORDER_KEYS = ("orderId", "symbol", "side", "type", "origQty",
+               "price", "status", "executedQty", "updateTime")
+_RESULT_KEYS = ("orderId", "symbol", "side", "type", "quantity",
+                "price", "status", "executedQuantity", "timestamp")
+_get_order_fields = operator.itemgetter(*_ORDER_KEYS)
+
 
 class OrderExecutor:
     """
@@ -17,17 +32,22 @@ class OrderExecutor:
     Coordinates validation, API interaction, and result handling.
     """
 
-    def __init__(self):
-        """Initialize order executor with API client."""
-        self.api_client = BinanceFuturesClient()
+    def __init__(self, api_client: Optional[BinanceFuturesClient] = None):
+        """
+        Initialize order executor with API client.
+
+        Args:
+            api_client: API client (defaults to the shared client)
+        """
+        self.api_client = api_client or get_client()
 
     def execute_order(
         self,
         symbol: str,
         side: str,
         order_type: str,
-        quantity: str,
-        price: str = None
+        quantity: Union[str, Decimal],
+        price: Union[str, Decimal, None] = None
     ) -> Dict[str, Any]:
         """
         Execute a complete order workflow: validate, summarize, place, report.
@@ -46,12 +66,15 @@ class OrderExecutor:
             ValidationError: If validation fails
             APIError: If order placement fails
         """
-        # Step 1: Validate all inputs
+        # Step 1: Validate and normalize all inputs
         try:
-            InputValidator.validate_all(
+            symbol, side, order_type, quantity, price = InputValidator.validate_all(
                 symbol, side, order_type, quantity, price)
+            InputValidator.validate_exchange_filters(
+                symbol, order_type, quantity, price,
+                self.api_client.get_symbol_info(symbol))
         except ValidationError as e:
-            logger.error(f"Validation failed: {str(e)}")
+            logger.error("Validation failed: %s", e)
             raise
 
         # Step 2: Generate order summary
@@ -59,27 +82,141 @@ class OrderExecutor:
             symbol, side, order_type, quantity, price)
         self._print_order_summary(summary)
 
-        # Step 3: Prepare parameters
-        qty_float = float(quantity)
-        price_float = float(price) if price else None
-
-        # Step 4: Execute order
+        # Step 3: Execute order (numeric values were parsed at the CLI boundary)
         try:
             response = self.api_client.place_order(
                 symbol=symbol,
                 side=side,
                 order_type=order_type,
-                quantity=qty_float,
-                price=price_float
+                quantity=quantity,
+                price=price
             )
         except APIError as e:
-            logger.error(f"Order execution failed: {str(e)}")
+            logger.error("Order execution failed: %s", e)
             raise
 
-        # Step 5: Parse and return result
+        # Step 4: Parse and return result
         result = self._parse_order_response(response)
         return result
 
+    def execute_orders_batch(
+        self,
+        orders: List[Dict[str, Any]],
+        parallel: bool = False
+    ) -> List[Dict[str, Any]]:
+        """
+        Validate and place several orders in as few requests as possible.
+
+        Args:
+            orders: Order dicts with symbol, side, order_type, quantity, price
+            parallel: Send orders as concurrent individual requests
+                instead of native batch requests
+
+        Returns:
+            One result dictionary per order, in input order
+
+        Raises:
+            ValidationError: If any order fails validation (nothing is placed)
+        """
+        # Step 1: Validate every order before anything is sent
+        orders = self._validate_orders(orders)
+
+        # Step 2: Place orders
+        responses = self.api_client.place_orders_batch(
+            orders, parallel=parallel)
+
+        # Step 3: Build per-order results
+        return self._build_batch_results(orders, responses)
+
+    def execute_orders_async(self, orders: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """
+        Validate and place several orders concurrently on an asyncio event loop.
+
+        Args:
+            orders: Order dicts with symbol, side, order_type, quantity, price
+
+        Returns:
+            One result dictionary per order, in input order
+
+        Raises:
+            ValidationError: If any order fails validation (nothing is placed)
+            APIError: If the async client cannot connect
+        """
+        from trading_bot.api_client_async import place_orders_async, run
+
+        orders = self._validate_orders(orders)
+        responses = run(place_orders_async(orders))
+        return self._build_batch_results(orders, responses)
+
+    def _validate_orders(self, orders: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """
+        Validate and normalize every order in a batch.
+
+        Args:
+            orders: Order dicts with symbol, side, order_type, quantity, price
+
+        Returns:
+            Normalized order dicts, in input order
+
+        Raises:
+            ValidationError: If any order fails validation
+        """
+        try:
+            checked = InputValidator.validate_batch(orders)
+        except ValidationError as e:
+            logger.error("Validation failed: %s", e)
+            raise
+
+        normalized = []
+        for index, (symbol, side, order_type, quantity, price) in enumerate(checked, 1):
+            try:
+                InputValidator.validate_exchange_filters(
+                    symbol, order_type, quantity, price,
+                    self.api_client.get_symbol_info(symbol))
+            except ValidationError as e:
+                logger.error("Validation failed for order #%d: %s", index, e)
+                raise ValidationError(f"Order #{index}: {str(e)}") from e
+
+            normalized.append({
+                "symbol": symbol,
+                "side": side,
+                "order_type": order_type,
+                "quantity": quantity,
+                "price": price,
+            })
+        return normalized
+
+    def _build_batch_results(
+        self,
+        orders: List[Dict[str, Any]],
+        responses: List[Tuple[bool, Any]]
+    ) -> List[Dict[str, Any]]:
+        """
+        Pair batch responses with their orders and build result dictionaries.
+
+        Args:
+            orders: Submitted order dicts
+            responses: (success, response or error) tuples in order
+
+        Returns:
+            One result dictionary per order
+        """
+        results = []
+        for order, (success, payload) in zip(orders, responses):
+            if success:
+                results.append(self._build_order_result(payload))
+            else:
+                results.append({
+                    "success": False,
+                    "symbol": order.get("symbol"),
+                    "error": str(payload),
+                })
+
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Batch completed: %d/%d orders placed",
+                         sum(r["success"] for r in results), len(results))
+        return results
+
     def _generate_order_summary(
         self,
         symbol: str,
@@ -93,8 +230,8 @@ class OrderExecutor:
 
         Args:
             symbol: Trading pair
-            side: Order side
-            order_type: Order type
+            side: Normalized order side
+            order_type: Normalized order type
             quantity: Order quantity
             price: Order price
 
@@ -103,12 +240,12 @@ class OrderExecutor:
         """
         summary = {
             "symbol": symbol,
-            "side": side.upper(),
-            "type": order_type.upper(),
+            "side": side,
+            "type": order_type,
             "quantity": quantity,
         }
 
-        if order_type.upper() == "LIMIT":
+        if order_type == "LIMIT":
             summary["price"] = price
         else:
             summary["price"] = "Market Price"
@@ -123,14 +260,34 @@ class OrderExecutor:
         Args:
             summary: Order summary dictionary
         """
-        print("\n" + "="*60)
-        print("ORDER SUMMARY")
-        print("="*60)
-        for key, value in summary.items():
-            print(f"{key.upper():.<20} {value}")
-        print("="*60 + "\n")
+        lines = ["", _BAR, "ORDER SUMMARY", _BAR]
+        lines.extend(f"{key.upper():.<20} {value}" for key, value in summary.items())
+        lines.extend([_BAR, ""])
+        sys.stdout.write("\n".join(lines) + "\n")
+
+        # Already shown on stdout; keep a copy in the log file only
+        logger.debug("Order summary displayed: %s", summary)
+
+    @staticmethod
+    def _build_order_result(response: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Extract relevant order details from an API response.
+
+        Args:
+            response: Raw API response
+
+        Returns:
+            Order result dictionary
+        """
+        try:
+            values = _get_order_fields(response)
+        except KeyError:
+            # Partial response: fall back to per-key lookups with None defaults
+            values = tuple(response.get(key) for key in _ORDER_KEYS)
 
-        logger.info(f"Order summary displayed: {summary}")
+        result = {"success": True}
+        result.update(zip(_RESULT_KEYS, values))
+        return result
 
     @staticmethod
     def _parse_order_response(response: Dict[str, Any]) -> Dict[str, Any]:
@@ -143,28 +300,20 @@ class OrderExecutor:
         Returns:
             Parsed order result
         """
-        result = {
-            "success": True,
-            "orderId": response.get("orderId"),
-            "symbol": response.get("symbol"),
-            "side": response.get("side"),
-            "type": response.get("type"),
-            "quantity": response.get("origQty"),
-            "price": response.get("price"),
-            "status": response.get("status"),
-            "executedQuantity": response.get("executedQty"),
-            "timestamp": response.get("updateTime"),
-        }
+        result = OrderExecutor._build_order_result(response)
 
         # Print success message
-        print("\n" + "✓ "*30)
-        print(f"Order placed successfully!")
-        print(f"Order ID: {result['orderId']}")
-        print(f"Status: {result['status']}")
-        print(
-            f"Executed Quantity: {result['executedQuantity']} {result['symbol']}")
-        print("✓ "*30 + "\n")
-
-        logger.info(
-            f"Order execution completed: Order ID {result['orderId']}, Status: {result['status']}")
+        sys.stdout.write("\n".join([
+            "",
+            _CHECK_BAR,
+            "Order placed successfully!",
+            f"Order ID: {result['orderId']}",
+            f"Status: {result['status']}",
+            f"Executed Quantity: {result['executedQuantity']} {result['symbol']}",
+            _CHECK_BAR,
+            "",
+        ]) + "\n")
+
+        logger.debug("Order execution completed: Order ID %s, Status: %s",
+                     result["orderId"], result["status"])
         return result
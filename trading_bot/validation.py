@@ -3,24 +3,252 @@ Validation layer for input verification and sanity checks.
 Ensures all user inputs meet requirements before order execution.
 """
 
-import re
-from typing import Tuple
+from decimal import Decimal, InvalidOperation
+from typing import Any, Callable, Dict, Final, Iterable, List, NoReturn, Optional, Sequence, Set, Tuple, Union
 from trading_bot.config import ALLOWED_ORDER_SIDES, ALLOWED_ORDER_TYPES
 from trading_bot.logging_config import get_logger
 
 logger = get_logger(__name__)
 
+# Config allow-lists case-folded (and de-duplicated, order kept) once at
+# import; the lookup tables and messages below are all derived from these
+_SIDES_U: Final = tuple(dict.fromkeys(s.upper() for s in ALLOWED_ORDER_SIDES))
+_TYPES_U: Final = tuple(dict.fromkeys(t.upper() for t in ALLOWED_ORDER_TYPES))
+
+# "Allowed values" text for error messages
+_ALLOWED_SIDES_MSG: Final = ", ".join(_SIDES_U)
+_ALLOWED_TYPES_MSG: Final = ", ".join(_TYPES_U)
+
+
+Number = Union[int, float, Decimal]
+
 
 class ValidationError(Exception):
     """Custom exception for validation failures."""
     pass
 
 
+# Shared instances for fixed-message failures, raised via _raise_shared.
+# Each raise resets the traceback, but the instance keeps its last traceback
+# (and any __context__ Python sets when raising inside a handler) until the
+# next raise; callers must not mutate or hold on to them.
+_ERR_EMPTY_SYMBOL: Final = ValidationError("Symbol cannot be empty")
+_ERR_EMPTY_SIDE: Final = ValidationError("Side cannot be empty")
+_ERR_EMPTY_ORDER_TYPE: Final = ValidationError("Order type cannot be empty")
+_ERR_EMPTY_QUANTITY: Final = ValidationError("Quantity cannot be empty")
+_ERR_PRICE_REQUIRED: Final = ValidationError("Price is required for LIMIT orders")
+
+
+def _raise_shared(error: ValidationError) -> NoReturn:
+    """
+    Raise a shared ValidationError, starting from an empty traceback.
+
+    Chaining is suppressed (from None), so a pending exception is not shown
+    with it, but Python still records that exception as __context__.
+
+    Args:
+        error: One of the module's preallocated _ERR_* instances
+
+    Raises:
+        ValidationError: Always (the given instance)
+    """
+    raise error.with_traceback(None) from None
+
+
+def _positive_number(value: Union[str, Number], field_name: str) -> Number:
+    """
+    Check that a value is a positive number.
+
+    Numeric values (e.g. Decimals from the CLI or a sizing calculation) are
+    used as-is; only strings are parsed.
+
+    Args:
+        value: Value to check (str, int, float or Decimal)
+        field_name: Name of field being validated (for error message)
+
+    Returns:
+        The value as a number
+
+    Raises:
+        ValidationError: If value is not numeric or not positive
+    """
+    number: Number
+    if isinstance(value, str):
+        try:
+            number = float(value)
+        except ValueError:
+            raise ValidationError(f"{field_name} must be numeric, got: '{value}'")
+    elif isinstance(value, (int, float, Decimal)) and not isinstance(value, bool):
+        number = value
+    else:
+        raise ValidationError(f"{field_name} must be numeric, got: '{value}'")
+
+    try:
+        positive = number > 0
+    except InvalidOperation:
+        # Decimal NaN does not compare
+        positive = False
+    if not positive:
+        raise ValidationError(f"{field_name} must be positive, got: {number}")
+
+    return number
+
+
+def _check_price(price: Union[str, Number, None], order_type_upper: str) -> None:
+    """
+    Apply the price rule for a canonical order type.
+
+    Price is required (and must be positive) for LIMIT orders and ignored,
+    with a warning, for MARKET orders.
+
+    Args:
+        price: Order price (or None for market orders)
+        order_type_upper: Canonical order type (MARKET or LIMIT)
+
+    Raises:
+        ValidationError: If a LIMIT price is missing or not a positive number
+    """
+    if order_type_upper == "LIMIT":
+        # Identity test first: a numeric 0 is a bad price, not a missing one
+        if price is None or (isinstance(price, str) and not price):
+            _raise_shared(_ERR_PRICE_REQUIRED)
+        _positive_number(price, "Price")
+    elif price is not None and price != "":
+        logger.warning("Price ignored for MARKET orders")
+
+
+def _case_variants(values: Iterable[str]) -> Dict[str, str]:
+    """
+    Map the common spellings of each allowed value to its canonical form.
+
+    Args:
+        values: Allowed values, already upper-case
+
+    Returns:
+        Dict from UPPER, lower and Capitalized spellings to the UPPER form
+    """
+    variants: Dict[str, str] = {}
+    for value in values:
+        for spelling in (value, value.lower(), value.capitalize()):
+            variants[spelling] = value
+    return variants
+
+
+def _canonicalize(
+    variants: Dict[str, str],
+    value: str,
+    field_name: str,
+    allowed_msg: str
+) -> str:
+    """
+    Resolve a side or order type to its canonical (upper-case) form.
+
+    Common spellings resolve with one dict lookup; other mixed-case spellings
+    fall back to .upper(). Non-strings fail the lookup or .upper() instead of
+    an isinstance check. Emptiness is left to the caller.
+
+    Args:
+        variants: Spelling -> canonical value (see _case_variants)
+        value: Value to resolve
+        field_name: Field name for error messages (e.g. "Side", "Order type")
+        allowed_msg: Precomputed "Allowed values" text for the table
+
+    Returns:
+        The canonical value
+
+    Raises:
+        ValidationError: If value is not a string or not an allowed value
+    """
+    try:
+        canonical = variants.get(value)
+        if canonical is None:
+            canonical = variants.get(value.upper())
+    except (AttributeError, TypeError):
+        raise ValidationError(f"{field_name} must be a string") from None
+    if canonical is None:
+        raise ValidationError(
+            f"Invalid {field_name.lower()}: '{value}'. Allowed values: {allowed_msg}"
+        )
+    return canonical
+
+
+def _build_order_checker(
+    sides: Dict[str, str],
+    types: Dict[str, str]
+) -> Callable[..., Tuple[str, str, str, Any, Any]]:
+    """
+    Build the fused per-order check, specialized for the given allow-lists.
+
+    The allow-lists and the number check are bound as closure variables, so
+    the hot path does no global or class attribute lookups for them.
+
+    Args:
+        sides: Side spelling -> canonical side (see _case_variants)
+        types: Order type spelling -> canonical order type
+
+    Returns:
+        check_order(symbol, side, order_type, quantity, price) returning the
+        normalized order tuple (raises ValidationError, does no logging)
+    """
+    positive_number = _positive_number
+    canonicalize = _canonicalize
+    check_price = _check_price
+    # Error text for the given tables, built once with the checker
+    sides_msg = ", ".join(dict.fromkeys(sides.values()))
+    types_msg = ", ".join(dict.fromkeys(types.values()))
+
+    def check_order(
+        symbol: str,
+        side: str,
+        order_type: str,
+        quantity: Union[str, Number],
+        price: Union[str, Number, None]
+    ) -> Tuple[str, str, str, Any, Any]:
+        # Same checks and messages as the per-field validators, inlined into
+        # one straight-line body (one frame, each value upper-cased once)
+        if not symbol:
+            _raise_shared(_ERR_EMPTY_SYMBOL)
+        try:
+            valid = symbol.endswith("USDT")
+            if valid:
+                base = symbol[:-4]
+                valid = base.isascii() and base.isalpha() and base.isupper()
+        except (AttributeError, TypeError):
+            raise ValidationError("Symbol must be a string")
+        if not valid:
+            raise ValidationError(
+                f"Invalid symbol format: '{symbol}'. "
+                "Expected format: XXXUSDT (e.g., BTCUSDT, ETHUSDT)"
+            )
+
+        if not side:
+            _raise_shared(_ERR_EMPTY_SIDE)
+        side_upper = canonicalize(sides, side, "Side", sides_msg)
+
+        if not order_type:
+            _raise_shared(_ERR_EMPTY_ORDER_TYPE)
+        order_type_upper = canonicalize(types, order_type, "Order type", types_msg)
+
+        if quantity is None or (isinstance(quantity, str) and not quantity):
+            _raise_shared(_ERR_EMPTY_QUANTITY)
+        positive_number(quantity, "Quantity")
+
+        check_price(price, order_type_upper)
+
+        return symbol, side_upper, order_type_upper, quantity, price
+
+    return check_order
+
+
 class InputValidator:
     """Validates all trading inputs according to specification."""
 
-    # Binance symbol format: uppercase letters followed by underscore and uppercase
-    SYMBOL_PATTERN = re.compile(r"^[A-Z]+USDT$")
+    # Common spellings -> canonical value (O(1) lookup, typical input skips .upper())
+    _SIDE_VARIANTS: Final[Dict[str, str]] = _case_variants(_SIDES_U)
+    _TYPE_VARIANTS: Final[Dict[str, str]] = _case_variants(_TYPES_U)
+
+    # Fused field checks used by validate_all and validate_batch
+    _check_order = staticmethod(_build_order_checker(_SIDE_VARIANTS, _TYPE_VARIANTS))
 
     @staticmethod
     def validate_symbol(symbol: str) -> None:
@@ -34,142 +262,201 @@ class InputValidator:
             ValidationError: If symbol is invalid
         """
         if not symbol:
-            raise ValidationError("Symbol cannot be empty")
+            _raise_shared(_ERR_EMPTY_SYMBOL)
 
-        if not isinstance(symbol, str):
+        try:
+            valid = InputValidator.is_valid_symbol(symbol)
+        except (AttributeError, TypeError):
             raise ValidationError("Symbol must be a string")
 
-        if not InputValidator.SYMBOL_PATTERN.match(symbol):
+        if not valid:
             raise ValidationError(
                 f"Invalid symbol format: '{symbol}'. "
                 "Expected format: XXXUSDT (e.g., BTCUSDT, ETHUSDT)"
             )
 
-        logger.debug(f"Symbol validation passed: {symbol}")
+        logger.debug("Symbol validation passed: %s", symbol)
 
     @staticmethod
-    def validate_side(side: str) -> None:
+    def is_valid_symbol(symbol: str) -> bool:
         """
-        Validate order side (BUY or SELL).
+        Check symbol format (XXXUSDT) without raising.
+
+        Plain str methods instead of a regex: the format is simple enough that
+        endswith/isalpha/isupper beat regex matching.
+
+        Args:
+            symbol: Trading pair symbol
+
+        Returns:
+            True if symbol is one or more uppercase ASCII letters followed by USDT
+
+        Raises:
+            AttributeError, TypeError: If symbol is not a string
+        """
+        if not symbol.endswith("USDT"):
+            return False
+        # Only slice once the cheap suffix test has passed
+        base = symbol[:-4]
+        return base.isascii() and base.isalpha() and base.isupper()
+
+    @staticmethod
+    def validate_symbols(symbols: Iterable[str]) -> None:
+        """
+        Validate the format of many symbols at once.
+
+        Each distinct symbol is checked once, so repeated symbols in a large
+        batch (e.g. a backtest or market-data filter) cost a set lookup.
+
+        Args:
+            symbols: Trading pair symbols
+
+        Raises:
+            ValidationError: On the first invalid symbol, in input order
+        """
+        seen: Set[str] = set()
+        for symbol in symbols:
+            try:
+                if symbol in seen:
+                    continue
+            except TypeError:
+                # Unhashable: let validate_symbol report it
+                pass
+            InputValidator.validate_symbol(symbol)
+            seen.add(symbol)
+
+    @staticmethod
+    def canonicalize_side(side: str) -> str:
+        """
+        Return the canonical (upper-case) form of an order side.
+
+        BUY/buy/Buy resolve with one dict lookup; other mixed-case spellings
+        fall back to .upper(). Call once per order at the input boundary.
 
         Args:
             side: Order side
 
+        Returns:
+            Upper-cased side
+
         Raises:
-            ValidationError: If side is invalid
+            ValidationError: If side is empty, not a string, or not allowed
         """
         if not side:
-            raise ValidationError("Side cannot be empty")
+            _raise_shared(_ERR_EMPTY_SIDE)
+        return _canonicalize(
+            InputValidator._SIDE_VARIANTS, side, "Side", _ALLOWED_SIDES_MSG)
 
-        if not isinstance(side, str):
-            raise ValidationError("Side must be a string")
+    @staticmethod
+    def canonicalize_order_type(order_type: str) -> str:
+        """
+        Return the canonical (upper-case) form of an order type.
 
-        side_upper = side.upper()
-        if side_upper not in ALLOWED_ORDER_SIDES:
-            raise ValidationError(
-                f"Invalid side: '{side}'. Allowed values: {', '.join(ALLOWED_ORDER_SIDES)}"
-            )
+        Same lookup as canonicalize_side, without logging.
 
-        logger.debug(f"Side validation passed: {side_upper}")
+        Args:
+            order_type: Order type
+
+        Returns:
+            Upper-cased order type
+
+        Raises:
+            ValidationError: If order type is empty, not a string, or not allowed
+        """
+        if not order_type:
+            _raise_shared(_ERR_EMPTY_ORDER_TYPE)
+        return _canonicalize(
+            InputValidator._TYPE_VARIANTS, order_type, "Order type", _ALLOWED_TYPES_MSG)
 
     @staticmethod
-    def validate_order_type(order_type: str) -> None:
+    def validate_side(side: str) -> str:
+        """
+        Validate order side (BUY or SELL).
+
+        Args:
+            side: Order side
+
+        Returns:
+            Upper-cased side
+
+        Raises:
+            ValidationError: If side is invalid
+        """
+        side_upper = InputValidator.canonicalize_side(side)
+
+        logger.debug("Side validation passed: %s", side_upper)
+        return side_upper
+
+    @staticmethod
+    def validate_order_type(order_type: str) -> str:
         """
         Validate order type (MARKET or LIMIT).
 
         Args:
             order_type: Order type
 
+        Returns:
+            Upper-cased order type
+
         Raises:
             ValidationError: If order type is invalid
         """
-        if not order_type:
-            raise ValidationError("Order type cannot be empty")
-
-        if not isinstance(order_type, str):
-            raise ValidationError("Order type must be a string")
-
-        order_type_upper = order_type.upper()
-        if order_type_upper not in ALLOWED_ORDER_TYPES:
-            raise ValidationError(
-                f"Invalid order type: '{order_type}'. "
-                f"Allowed values: {', '.join(ALLOWED_ORDER_TYPES)}"
-            )
+        order_type_upper = InputValidator.canonicalize_order_type(order_type)
 
-        logger.debug(f"Order type validation passed: {order_type_upper}")
+        logger.debug("Order type validation passed: %s", order_type_upper)
+        return order_type_upper
 
     @staticmethod
-    def validate_quantity(quantity: str) -> None:
+    def validate_quantity(quantity: Union[str, Number]) -> None:
         """
         Validate order quantity is positive numeric value.
 
         Args:
-            quantity: Order quantity as string
+            quantity: Order quantity (numeric string, int, float or Decimal)
 
         Raises:
             ValidationError: If quantity is invalid
         """
-        if not quantity:
-            raise ValidationError("Quantity cannot be empty")
+        if quantity is None or (isinstance(quantity, str) and not quantity):
+            _raise_shared(_ERR_EMPTY_QUANTITY)
 
-        try:
-            qty_float = float(quantity)
-        except ValueError:
-            raise ValidationError(
-                f"Quantity must be numeric, got: '{quantity}'")
+        qty = _positive_number(quantity, "Quantity")
 
-        if qty_float <= 0:
-            raise ValidationError(
-                f"Quantity must be positive, got: {qty_float}")
-
-        logger.debug(f"Quantity validation passed: {qty_float}")
+        logger.debug("Quantity validation passed: %s", qty)
 
     @staticmethod
-    def validate_price(price: str, order_type: str) -> None:
+    def validate_price(price: Union[str, Number, None], order_type: str) -> None:
         """
         Validate price based on order type.
         Price is required for LIMIT orders, forbidden for MARKET orders.
 
         Args:
-            price: Order price as string (or None for market orders)
-            order_type: Order type (MARKET or LIMIT)
+            price: Order price (numeric string, int, float, Decimal, or None for market orders)
+            order_type: Order type (MARKET or LIMIT, any case)
 
         Raises:
-            ValidationError: If price validation fails
+            ValidationError: If the order type is invalid or price validation fails
         """
-        order_type_upper = order_type.upper()
+        order_type_upper = InputValidator.validate_order_type(order_type)
+        _check_price(price, order_type_upper)
 
         if order_type_upper == "LIMIT":
-            if not price:
-                raise ValidationError("Price is required for LIMIT orders")
-
-            try:
-                price_float = float(price)
-            except ValueError:
-                raise ValidationError(f"Price must be numeric, got: '{price}'")
-
-            if price_float <= 0:
-                raise ValidationError(
-                    f"Price must be positive, got: {price_float}")
-
-            logger.debug(
-                f"Price validation passed for LIMIT order: {price_float}")
-
-        elif order_type_upper == "MARKET":
-            if price:
-                logger.warning("Price ignored for MARKET orders")
+            logger.debug("Price validation passed for LIMIT order: %s", price)
 
     @staticmethod
     def validate_all(
         symbol: str,
         side: str,
         order_type: str,
-        quantity: str,
-        price: str = None
-    ) -> None:
+        quantity: Union[str, Number],
+        price: Union[str, Number, None] = None
+    ) -> Tuple[str, str, str, Any, Any]:
         """
         Validate all input parameters together.
 
+        This is the normalization boundary: side and order type come back
+        upper-cased, so callers use the returned values and never re-normalize.
+
         Args:
             symbol: Trading pair symbol
             side: Order side (BUY/SELL)
@@ -177,16 +464,138 @@ class InputValidator:
             quantity: Order quantity
             price: Order price (optional, required for LIMIT)
 
+        Returns:
+            Normalized (symbol, side, order_type, quantity, price) tuple
+
         Raises:
             ValidationError: If any validation fails
         """
-        InputValidator.validate_symbol(symbol)
-        InputValidator.validate_side(side)
-        InputValidator.validate_order_type(order_type)
-        InputValidator.validate_quantity(quantity)
-        InputValidator.validate_price(price, order_type)
-
+        order = InputValidator._check_order(symbol, side, order_type, quantity, price)
         logger.info(
-            f"All validations passed: symbol={symbol}, side={side}, "
-            f"type={order_type}, qty={quantity}, price={price}"
+            "All validations passed: symbol=%s, side=%s, type=%s, qty=%s, price=%s",
+            *order
         )
+        return order
+
+    @staticmethod
+    def validate_batch(
+        orders: Sequence[Dict[str, Any]]
+    ) -> List[Tuple[str, str, str, Any, Any]]:
+        """
+        Validate many orders in one pass, logging once for the whole batch.
+
+        Args:
+            orders: Order dicts with symbol, side, order_type, quantity, price
+
+        Returns:
+            Normalized (symbol, side, order_type, quantity, price) tuples, in input order
+
+        Raises:
+            ValidationError: On the first invalid order, prefixed with its 1-based index
+        """
+        check = InputValidator._check_order
+        normalized: List[Tuple[str, str, str, Any, Any]] = []
+        for index, order in enumerate(orders, 1):
+            try:
+                get = order.get
+            except AttributeError:
+                raise ValidationError(f"Order #{index} must be an object") from None
+            try:
+                normalized.append(check(
+                    get("symbol"), get("side"), get("order_type"),
+                    get("quantity"), get("price")))
+            except ValidationError as e:
+                raise ValidationError(f"Order #{index}: {e}") from e
+
+        logger.info("All validations passed for %d orders", len(normalized))
+        return normalized
+
+    @staticmethod
+    def validate_exchange_filters(
+        symbol: str,
+        order_type: str,
+        quantity: Union[str, Number],
+        price: Union[str, Number, None],
+        symbol_info: Optional[Dict[str, Any]]
+    ) -> None:
+        """
+        Validate an order against the exchange's symbol filters.
+        Checks trading status, lot size (quantity) and price filter (LIMIT only).
+
+        Args:
+            symbol: Trading pair symbol
+            order_type: Normalized order type (MARKET/LIMIT, from validate_all)
+            quantity: Order quantity
+            price: Order price (used for LIMIT orders)
+            symbol_info: Symbol entry from exchange info (None if unlisted)
+
+        Raises:
+            ValidationError: If the order violates an exchange filter
+        """
+        if symbol_info is None:
+            raise ValidationError(f"Symbol '{symbol}' is not listed on the exchange")
+
+        status = symbol_info.get("status")
+        if status and status != "TRADING":
+            raise ValidationError(
+                f"Symbol '{symbol}' is not trading (status: {status})")
+
+        filters = {f.get("filterType"): f for f in symbol_info.get("filters", [])}
+        is_limit = order_type == "LIMIT"
+
+        lot_filter = filters.get("LOT_SIZE" if is_limit else "MARKET_LOT_SIZE") \
+            or filters.get("LOT_SIZE")
+        if lot_filter:
+            InputValidator._check_filter_range(
+                "Quantity", quantity, lot_filter.get("minQty"),
+                lot_filter.get("maxQty"), lot_filter.get("stepSize"))
+
+        price_filter = filters.get("PRICE_FILTER")
+        if is_limit and price_filter:
+            InputValidator._check_filter_range(
+                "Price", price, price_filter.get("minPrice"),
+                price_filter.get("maxPrice"), price_filter.get("tickSize"))
+
+        logger.debug("Exchange filter validation passed: %s", symbol)
+
+    @staticmethod
+    def _check_filter_range(
+        field_name: str,
+        value: Any,
+        minimum: Optional[str],
+        maximum: Optional[str],
+        step: Optional[str]
+    ) -> None:
+        """
+        Check a value against an exchange min/max/step filter.
+        Zero or missing filter values mean the bound is disabled.
+
+        Args:
+            field_name: Name of field being validated (for error message)
+            value: Value to check
+            minimum: Minimum allowed value
+            maximum: Maximum allowed value
+            step: Required increment from the minimum
+
+        Raises:
+            ValidationError: If the value is outside the filter
+        """
+        try:
+            number = Decimal(str(value))
+            low = Decimal(minimum or 0)
+            high = Decimal(maximum or 0)
+            increment = Decimal(step or 0)
+        except InvalidOperation:
+            raise ValidationError(f"{field_name} must be numeric, got: '{value}'")
+
+        if low and number < low:
+            raise ValidationError(
+                f"{field_name} {number} is below the minimum of {low.normalize()}")
+
+        if high and number > high:
+            raise ValidationError(
+                f"{field_name} {number} is above the maximum of {high.normalize()}")
+
+        if increment and (number - low) % increment != 0:
+            raise ValidationError(
+                f"{field_name} {number} must be a multiple of {increment.normalize()}")